@@ -19,35 +19,666 @@ Installation:
        }
      }
    }
+
+Set BLENDER_SOCK to the addon's socket path to connect over a Unix socket
+instead of TCP when Blender runs on the same machine.
 """
 
 import asyncio
 import base64
 import json
+import math
 import os
 import socket
-import tempfile
+import struct
+import sys
 from typing import Any, Optional
-from pathlib import Path
 
+import jsonschema
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import (
     Tool,
     TextContent,
     ImageContent,
-    EmbeddedResource,
 )
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Messages to and from the Blender addon are framed as a content type byte and
+# a 4-byte big-endian payload length, followed by the payload.
+_HEADER = struct.Struct(">BI")
+
+# Frame content types. Commands are always sent as JSON; Blender may answer
+# in MessagePack, which is smaller and faster to parse for float-heavy replies.
+_JSON = 1
+_MSGPACK = 2
+# Images (screenshots and renders) come back as raw PNG bytes in a binary frame
+_BINARY = 3
+
+# Seconds to wait for Blender to answer a single command.
+_TIMEOUT = 30.0
+
+# Kernel socket buffer sizes for the connection to Blender. Replies such as
+# renders and screenshots are much larger than commands.
+_SEND_BUFFER_SIZE = 256 * 1024
+_RECV_BUFFER_SIZE = 1024 * 1024
+
+# Shared, immutable defaults for vector arguments
+_ZERO3 = (0.0, 0.0, 0.0)
+_ONE3 = (1.0, 1.0, 1.0)
+
+
+# Wire codec for messages to and from Blender. msgspec and orjson are
+# optional, in that order of preference; both encode straight to bytes and
+# parse bytes without decoding. _DecodeError is what _decode raises on
+# malformed input (orjson's error subclasses json.JSONDecodeError).
+if msgspec is not None:
+    _encode = msgspec.json.Encoder().encode
+    _decode = msgspec.json.Decoder().decode
+    _DecodeError = msgspec.DecodeError
+elif orjson is not None:
+    _encode = orjson.dumps
+    _decode = orjson.loads
+    _DecodeError = json.JSONDecodeError
+else:
+
+    def _encode(obj: Any) -> bytes:
+        """Encode a message for the Blender addon"""
+        return json.dumps(obj).encode("utf-8")
+
+    def _decode(data: bytes) -> Any:
+        """Decode a message from the Blender addon"""
+        return json.loads(data)
+
+    _DecodeError = json.JSONDecodeError
+
+
+# MessagePack replies are only requested when msgspec can decode them; its
+# decoders share msgspec.DecodeError with the JSON codec above.
+if msgspec is not None:
+    _decode_msgpack = msgspec.msgpack.Decoder().decode
+else:
+    _decode_msgpack = None
+
+
+# json.dumps() builds a new encoder whenever options are passed, so the
+# compact encoder for tool results is created once and reused.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _vec3(value: Any) -> tuple[float, float, float]:
+    """Coerce a 3-component vector argument to finite floats"""
+    x, y, z = (float(v) for v in value)
+    if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(z)):
+        raise ValueError(f"Vector components must be finite numbers: {value!r}")
+    return x, y, z
+
+
+def _err(message: str) -> list[TextContent]:
+    """Build the tool response for an error message"""
+    return [TextContent(type="text", text=message)]
+
+
+# Tool definitions are static, so they are built once at import time.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_scene_info",
+        description="Get detailed information about the current Blender scene including objects, camera, lights, and materials",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_viewport_screenshot",
+        description="Capture a screenshot of a Blender editor area. Returns the image as base64-encoded PNG.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "max_size": {
+                    "type": "integer",
+                    "description": "Maximum size in pixels for the largest dimension (default: 800)",
+                    "default": 800,
+                },
+                "area_type": {
+                    "type": "string",
+                    "description": "Blender editor area type to capture (default: VIEW_3D)",
+                    "default": "VIEW_3D",
+                    "enum": [
+                        "VIEW_3D",
+                        "IMAGE_EDITOR",
+                        "UV_EDITOR",
+                        "NODE_EDITOR",
+                        "TEXT_EDITOR",
+                        "PROPERTIES",
+                        "OUTLINER",
+                        "PREFERENCES",
+                        "CONSOLE",
+                        "TIMELINE",
+                        "DOPESHEET_EDITOR",
+                        "GRAPH_EDITOR",
+                        "NLA_EDITOR",
+                        "SEQUENCE_EDITOR",
+                        "CLIP_EDITOR",
+                        "SPREADSHEET",
+                    ],
+                },
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_object_info",
+        description="Get detailed information about a specific object in the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object to inspect",
+                },
+            },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="execute_python",
+        description="Execute arbitrary Python code in Blender. Use with caution. Code runs in Blender's context with 'bpy' available.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "code": {
+                    "type": "string",
+                    "description": "Python code to execute",
+                },
+                "capture_output": {
+                    "type": "boolean",
+                    "description": "Return what the code prints (default: true). Set to false when the output is not needed.",
+                },
+            },
+            "required": ["code"],
+        },
+    ),
+    Tool(
+        name="create_object",
+        description="Create a new object in the scene (mesh primitive, light, camera, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_type": {
+                    "type": "string",
+                    "enum": [
+                        "CUBE",
+                        "SPHERE",
+                        "CYLINDER",
+                        "CONE",
+                        "TORUS",
+                        "PLANE",
+                        "MONKEY",
+                        "CAMERA",
+                        "LIGHT",
+                    ],
+                    "description": "Type of object to create",
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Name for the new object",
+                },
+                "location": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "Location [x, y, z] in world space",
+                    "default": [0, 0, 0],
+                },
+                "rotation": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "Rotation [x, y, z] in radians",
+                    "default": [0, 0, 0],
+                },
+                "scale": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "Scale [x, y, z]",
+                    "default": [1, 1, 1],
+                },
+            },
+            "required": ["object_type"],
+        },
+    ),
+    Tool(
+        name="modify_object",
+        description="Modify an existing object's transform, visibility, or other properties",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object to modify",
+                },
+                "location": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "New location [x, y, z]",
+                },
+                "rotation": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "New rotation [x, y, z] in radians",
+                },
+                "scale": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "New scale [x, y, z]",
+                },
+                "visible": {
+                    "type": "boolean",
+                    "description": "Set visibility",
+                },
+            },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="delete_object",
+        description="Delete an object from the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object to delete",
+                },
+            },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="select_objects",
+        description="Select or deselect objects in the scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "List of object names to select",
+                },
+                "deselect_all": {
+                    "type": "boolean",
+                    "description": "Deselect all objects first",
+                    "default": True,
+                },
+            },
+            "required": ["object_names"],
+        },
+    ),
+    Tool(
+        name="render_image",
+        description="Render the current scene and return the rendered image",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "resolution_x": {
+                    "type": "integer",
+                    "description": "Render width in pixels",
+                    "default": 1920,
+                },
+                "resolution_y": {
+                    "type": "integer",
+                    "description": "Render height in pixels",
+                    "default": 1080,
+                },
+                "samples": {
+                    "type": "integer",
+                    "description": "Number of render samples (higher = better quality, slower)",
+                    "default": 128,
+                },
+            },
+            "required": [],
+        },
+    ),
+    Tool(
+        name="get_modifiers",
+        description="List all modifiers on an object with their properties",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object to inspect",
+                },
+            },
+            "required": ["object_name"],
+        },
+    ),
+    Tool(
+        name="add_modifier",
+        description="Add a modifier to an object",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object to add the modifier to",
+                },
+                "modifier_type": {
+                    "type": "string",
+                    "enum": [
+                        "SUBSURF",
+                        "BEVEL",
+                        "ARRAY",
+                        "MIRROR",
+                        "BOOLEAN",
+                        "SOLIDIFY",
+                        "WIREFRAME",
+                        "DECIMATE",
+                        "REMESH",
+                        "SMOOTH",
+                        "SHRINKWRAP",
+                        "CURVE",
+                        "NODES",
+                    ],
+                    "description": "Type of modifier to add",
+                },
+                "modifier_name": {
+                    "type": "string",
+                    "description": "Custom name for the modifier (optional)",
+                },
+                "properties": {
+                    "type": "object",
+                    "description": 'Property name-value pairs to set on the modifier (e.g. {"levels": 3})',
+                },
+            },
+            "required": ["object_name", "modifier_type"],
+        },
+    ),
+    Tool(
+        name="remove_modifier",
+        description="Remove a modifier from an object",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object",
+                },
+                "modifier_name": {
+                    "type": "string",
+                    "description": "Name of the modifier to remove",
+                },
+            },
+            "required": ["object_name", "modifier_name"],
+        },
+    ),
+    Tool(
+        name="apply_modifier",
+        description="Apply a modifier (bakes it into the mesh)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object",
+                },
+                "modifier_name": {
+                    "type": "string",
+                    "description": "Name of the modifier to apply",
+                },
+            },
+            "required": ["object_name", "modifier_name"],
+        },
+    ),
+    Tool(
+        name="set_geometry_nodes_input",
+        description="Set an input value on a Geometry Nodes modifier",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Name of the object",
+                },
+                "modifier_name": {
+                    "type": "string",
+                    "description": "Name of the Geometry Nodes modifier",
+                },
+                "input_name": {
+                    "type": "string",
+                    "description": "Input identifier (e.g. 'Socket_2') or display name",
+                },
+                "value": {
+                    "description": "Value to set (number, array, string, or boolean)",
+                },
+            },
+            "required": [
+                "object_name",
+                "modifier_name",
+                "input_name",
+                "value",
+            ],
+        },
+    ),
+    Tool(
+        name="list_asset_libraries",
+        description="List all asset libraries configured in Blender preferences",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "required": [],
+        },
+    ),
+    Tool(
+        name="list_assets",
+        description="List/search assets available in a specific asset library",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "library_name": {
+                    "type": "string",
+                    "description": "Name of the asset library (from list_asset_libraries)",
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Filter asset names (case-insensitive substring match)",
+                    "default": "",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "Pagination offset",
+                    "default": 0,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Max results to return",
+                    "default": 50,
+                },
+            },
+            "required": ["library_name"],
+        },
+    ),
+    Tool(
+        name="add_asset_to_scene",
+        description="Append an asset from a library into the current scene",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "library_name": {
+                    "type": "string",
+                    "description": "Name of the asset library",
+                },
+                "asset_name": {
+                    "type": "string",
+                    "description": "Name of the asset (folder name or file stem)",
+                },
+                "location": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": 3,
+                    "maxItems": 3,
+                    "description": "Where to place the asset [x, y, z]",
+                    "default": [0, 0, 0],
+                },
+            },
+            "required": ["library_name", "asset_name"],
+        },
+    ),
+    Tool(
+        name="batch",
+        description="Run several object and modifier operations in order with a single round trip to Blender. Stops at the first operation that fails.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "minItems": 1,
+                    "description": "Operations to run, in order",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "tool": {
+                                "type": "string",
+                                "enum": [
+                                    "create_object",
+                                    "modify_object",
+                                    "delete_object",
+                                    "select_objects",
+                                    "add_modifier",
+                                    "remove_modifier",
+                                    "apply_modifier",
+                                    "set_geometry_nodes_input",
+                                ],
+                                "description": "Name of the tool to run",
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool, as for a direct call",
+                                "default": {},
+                            },
+                        },
+                        "required": ["tool"],
+                    },
+                },
+            },
+            "required": ["operations"],
+        },
+    ),
+]
+
+# The MCP framework would otherwise build a fresh validator from the schema on
+# every call; the schemas never change, so compile each one once and reuse it.
+_VALIDATORS = {
+    tool.name: jsonschema.validators.validator_for(tool.inputSchema)(tool.inputSchema)
+    for tool in _TOOLS
+}
+
+
+class BlenderCommError(Exception):
+    """Raised when Blender sends a reply that cannot be understood"""
+
+    def __init__(self, message: str):
+        super().__init__(f"Failed to communicate with Blender: {message}")
+
+
+class BlenderCommandError(Exception):
+    """Raised when Blender reports that a command failed"""
+
 
 class BlenderMCPServer:
     """MCP Server for Blender integration"""
 
-    def __init__(self, host: str = "localhost", port: int = 9876):
+    __slots__ = (
+        "host",
+        "port",
+        "socket_path",
+        "server",
+        "_reader",
+        "_writer",
+        "_io_lock",
+        "_dispatch",
+        "_batch_commands",
+        "_init_opts",
+    )
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 9876,
+        socket_path: Optional[str] = None,
+    ):
         self.host = host
         self.port = port
+        # Unix socket path of a Blender running on the same machine; when set
+        # it is used instead of host/port.
+        self.socket_path = socket_path
         self.server = Server("blender-mcp")
+        # A single connection to Blender is kept open and reused; the lock
+        # keeps one command in flight at a time so responses stay in order.
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._io_lock = asyncio.Lock()
+        self._dispatch = {
+            "get_scene_info": self._handle_get_scene_info,
+            "get_viewport_screenshot": self._handle_get_viewport_screenshot,
+            "get_object_info": self._handle_get_object_info,
+            "execute_python": self._handle_execute_python,
+            "create_object": self._handle_create_object,
+            "modify_object": self._handle_modify_object,
+            "delete_object": self._handle_delete_object,
+            "select_objects": self._handle_select_objects,
+            "render_image": self._handle_render_image,
+            "get_modifiers": self._handle_get_modifiers,
+            "add_modifier": self._handle_add_modifier,
+            "remove_modifier": self._handle_remove_modifier,
+            "apply_modifier": self._handle_apply_modifier,
+            "set_geometry_nodes_input": self._handle_set_geometry_nodes_input,
+            "list_asset_libraries": self._handle_list_asset_libraries,
+            "list_assets": self._handle_list_assets,
+            "add_asset_to_scene": self._handle_add_asset_to_scene,
+            "batch": self._handle_batch,
+        }
+        # Tools that can run inside a batch, mapped to their command builders
+        self._batch_commands = {
+            "create_object": self._command_create_object,
+            "modify_object": self._command_modify_object,
+            "delete_object": self._command_delete_object,
+            "select_objects": self._command_select_objects,
+            "add_modifier": self._command_add_modifier,
+            "remove_modifier": self._command_remove_modifier,
+            "apply_modifier": self._command_apply_modifier,
+            "set_geometry_nodes_input": self._command_set_geometry_nodes_input,
+        }
         self._setup_handlers()
+        # Capabilities are derived from the registered handlers, so this has
+        # to come after _setup_handlers()
+        self._init_opts = self.server.create_initialization_options()
 
     def _setup_handlers(self):
         """Register all MCP handlers"""
@@ -55,798 +686,475 @@ class BlenderMCPServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List all available tools"""
-            return [
-                Tool(
-                    name="get_scene_info",
-                    description="Get detailed information about the current Blender scene including objects, camera, lights, and materials",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="get_viewport_screenshot",
-                    description="Capture a screenshot of a Blender editor area. Returns the image as base64-encoded PNG.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "max_size": {
-                                "type": "integer",
-                                "description": "Maximum size in pixels for the largest dimension (default: 800)",
-                                "default": 800,
-                            },
-                            "area_type": {
-                                "type": "string",
-                                "description": "Blender editor area type to capture (default: VIEW_3D)",
-                                "default": "VIEW_3D",
-                                "enum": [
-                                    "VIEW_3D",
-                                    "IMAGE_EDITOR",
-                                    "UV_EDITOR",
-                                    "NODE_EDITOR",
-                                    "TEXT_EDITOR",
-                                    "PROPERTIES",
-                                    "OUTLINER",
-                                    "PREFERENCES",
-                                    "CONSOLE",
-                                    "TIMELINE",
-                                    "DOPESHEET_EDITOR",
-                                    "GRAPH_EDITOR",
-                                    "NLA_EDITOR",
-                                    "SEQUENCE_EDITOR",
-                                    "CLIP_EDITOR",
-                                    "SPREADSHEET",
-                                ],
-                            },
-                        },
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="get_object_info",
-                    description="Get detailed information about a specific object in the scene",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object to inspect",
-                            },
-                        },
-                        "required": ["object_name"],
-                    },
-                ),
-                Tool(
-                    name="execute_python",
-                    description="Execute arbitrary Python code in Blender. Use with caution. Code runs in Blender's context with 'bpy' available.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "code": {
-                                "type": "string",
-                                "description": "Python code to execute",
-                            },
-                        },
-                        "required": ["code"],
-                    },
-                ),
-                Tool(
-                    name="create_object",
-                    description="Create a new object in the scene (mesh primitive, light, camera, etc.)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_type": {
-                                "type": "string",
-                                "enum": [
-                                    "CUBE",
-                                    "SPHERE",
-                                    "CYLINDER",
-                                    "CONE",
-                                    "TORUS",
-                                    "PLANE",
-                                    "MONKEY",
-                                    "CAMERA",
-                                    "LIGHT",
-                                ],
-                                "description": "Type of object to create",
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Name for the new object",
-                            },
-                            "location": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "Location [x, y, z] in world space",
-                                "default": [0, 0, 0],
-                            },
-                            "rotation": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "Rotation [x, y, z] in radians",
-                                "default": [0, 0, 0],
-                            },
-                            "scale": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "Scale [x, y, z]",
-                                "default": [1, 1, 1],
-                            },
-                        },
-                        "required": ["object_type"],
-                    },
-                ),
-                Tool(
-                    name="modify_object",
-                    description="Modify an existing object's transform, visibility, or other properties",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object to modify",
-                            },
-                            "location": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "New location [x, y, z]",
-                            },
-                            "rotation": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "New rotation [x, y, z] in radians",
-                            },
-                            "scale": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "New scale [x, y, z]",
-                            },
-                            "visible": {
-                                "type": "boolean",
-                                "description": "Set visibility",
-                            },
-                        },
-                        "required": ["object_name"],
-                    },
-                ),
-                Tool(
-                    name="delete_object",
-                    description="Delete an object from the scene",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object to delete",
-                            },
-                        },
-                        "required": ["object_name"],
-                    },
-                ),
-                Tool(
-                    name="select_objects",
-                    description="Select or deselect objects in the scene",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_names": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "List of object names to select",
-                            },
-                            "deselect_all": {
-                                "type": "boolean",
-                                "description": "Deselect all objects first",
-                                "default": True,
-                            },
-                        },
-                        "required": ["object_names"],
-                    },
-                ),
-                Tool(
-                    name="render_image",
-                    description="Render the current scene and return the rendered image",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "resolution_x": {
-                                "type": "integer",
-                                "description": "Render width in pixels",
-                                "default": 1920,
-                            },
-                            "resolution_y": {
-                                "type": "integer",
-                                "description": "Render height in pixels",
-                                "default": 1080,
-                            },
-                            "samples": {
-                                "type": "integer",
-                                "description": "Number of render samples (higher = better quality, slower)",
-                                "default": 128,
-                            },
-                        },
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="get_modifiers",
-                    description="List all modifiers on an object with their properties",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object to inspect",
-                            },
-                        },
-                        "required": ["object_name"],
-                    },
-                ),
-                Tool(
-                    name="add_modifier",
-                    description="Add a modifier to an object",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object to add the modifier to",
-                            },
-                            "modifier_type": {
-                                "type": "string",
-                                "enum": [
-                                    "SUBSURF",
-                                    "BEVEL",
-                                    "ARRAY",
-                                    "MIRROR",
-                                    "BOOLEAN",
-                                    "SOLIDIFY",
-                                    "WIREFRAME",
-                                    "DECIMATE",
-                                    "REMESH",
-                                    "SMOOTH",
-                                    "SHRINKWRAP",
-                                    "CURVE",
-                                    "NODES",
-                                ],
-                                "description": "Type of modifier to add",
-                            },
-                            "modifier_name": {
-                                "type": "string",
-                                "description": "Custom name for the modifier (optional)",
-                            },
-                            "properties": {
-                                "type": "object",
-                                "description": 'Property name-value pairs to set on the modifier (e.g. {"levels": 3})',
-                            },
-                        },
-                        "required": ["object_name", "modifier_type"],
-                    },
-                ),
-                Tool(
-                    name="remove_modifier",
-                    description="Remove a modifier from an object",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object",
-                            },
-                            "modifier_name": {
-                                "type": "string",
-                                "description": "Name of the modifier to remove",
-                            },
-                        },
-                        "required": ["object_name", "modifier_name"],
-                    },
-                ),
-                Tool(
-                    name="apply_modifier",
-                    description="Apply a modifier (bakes it into the mesh)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object",
-                            },
-                            "modifier_name": {
-                                "type": "string",
-                                "description": "Name of the modifier to apply",
-                            },
-                        },
-                        "required": ["object_name", "modifier_name"],
-                    },
-                ),
-                Tool(
-                    name="set_geometry_nodes_input",
-                    description="Set an input value on a Geometry Nodes modifier",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "object_name": {
-                                "type": "string",
-                                "description": "Name of the object",
-                            },
-                            "modifier_name": {
-                                "type": "string",
-                                "description": "Name of the Geometry Nodes modifier",
-                            },
-                            "input_name": {
-                                "type": "string",
-                                "description": "Input identifier (e.g. 'Socket_2') or display name",
-                            },
-                            "value": {
-                                "description": "Value to set (number, array, string, or boolean)",
-                            },
-                        },
-                        "required": [
-                            "object_name",
-                            "modifier_name",
-                            "input_name",
-                            "value",
-                        ],
-                    },
-                ),
-                Tool(
-                    name="list_asset_libraries",
-                    description="List all asset libraries configured in Blender preferences",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": [],
-                    },
-                ),
-                Tool(
-                    name="list_assets",
-                    description="List/search assets available in a specific asset library",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "library_name": {
-                                "type": "string",
-                                "description": "Name of the asset library (from list_asset_libraries)",
-                            },
-                            "search": {
-                                "type": "string",
-                                "description": "Filter asset names (case-insensitive substring match)",
-                                "default": "",
-                            },
-                            "offset": {
-                                "type": "integer",
-                                "description": "Pagination offset",
-                                "default": 0,
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Max results to return",
-                                "default": 50,
-                            },
-                        },
-                        "required": ["library_name"],
-                    },
-                ),
-                Tool(
-                    name="add_asset_to_scene",
-                    description="Append an asset from a library into the current scene",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "library_name": {
-                                "type": "string",
-                                "description": "Name of the asset library",
-                            },
-                            "asset_name": {
-                                "type": "string",
-                                "description": "Name of the asset (folder name or file stem)",
-                            },
-                            "location": {
-                                "type": "array",
-                                "items": {"type": "number"},
-                                "minItems": 3,
-                                "maxItems": 3,
-                                "description": "Where to place the asset [x, y, z]",
-                                "default": [0, 0, 0],
-                            },
-                        },
-                        "required": ["library_name", "asset_name"],
-                    },
-                ),
-            ]
+            return _TOOLS
 
-        @self.server.call_tool()
+        @self.server.call_tool(validate_input=False)
         async def call_tool(
             name: str, arguments: Any
         ) -> list[TextContent | ImageContent]:
             """Handle tool calls"""
+            handler = self._dispatch.get(name)
+            if handler is None:
+                return _err(f"Unknown tool: {name}")
+            error = jsonschema.exceptions.best_match(
+                _VALIDATORS[name].iter_errors(arguments)
+            )
+            if error is not None:
+                # Raised rather than returned so the framework marks the
+                # result as an error, as its own validation would
+                raise ValueError(f"Input validation error: {error.message}")
+            # Anything else (e.g. an error reported by Blender) propagates to
+            # the MCP framework, which returns it as an error result.
             try:
-                if name == "get_scene_info":
-                    result = await self._send_command("get_scene_info", {})
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "get_viewport_screenshot":
-                    max_size = arguments.get("max_size", 800)
-                    area_type = arguments.get("area_type", "VIEW_3D")
-                    result = await self._send_command(
-                        "get_viewport_screenshot", {"max_size": max_size, "area_type": area_type}
-                    )
-                    image_data = result.get("image_data", "")
-                    if image_data:
-                        return [
-                            TextContent(
-                                type="text",
-                                text=f"{area_type} screenshot captured ({max_size}px max)",
-                            ),
-                            ImageContent(
-                                type="image",
-                                data=image_data,
-                                mimeType="image/png",
-                            ),
-                        ]
-                    else:
-                        return [
-                            TextContent(
-                                type="text",
-                                text="Screenshot failed: no image data returned",
-                            )
-                        ]
-
-                elif name == "get_object_info":
-                    result = await self._send_command(
-                        "get_object_info", {"name": arguments["object_name"]}
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "execute_python":
-                    result = await self._send_command(
-                        "execute_code", {"code": arguments["code"]}
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "create_object":
-                    obj_type = arguments["object_type"]
-                    name = arguments.get("name", obj_type.lower())
-                    loc = arguments.get("location", [0, 0, 0])
-                    rot = arguments.get("rotation", [0, 0, 0])
-                    scale = arguments.get("scale", [1, 1, 1])
-
-                    code = f'''
-import bpy
-import mathutils
-
-# Create object based on type
-obj_type = "{obj_type}"
-
-if obj_type == "CUBE":
-    bpy.ops.mesh.primitive_cube_add()
-elif obj_type == "SPHERE":
-    bpy.ops.mesh.primitive_uv_sphere_add()
-elif obj_type == "CYLINDER":
-    bpy.ops.mesh.primitive_cylinder_add()
-elif obj_type == "CONE":
-    bpy.ops.mesh.primitive_cone_add()
-elif obj_type == "TORUS":
-    bpy.ops.mesh.primitive_torus_add()
-elif obj_type == "PLANE":
-    bpy.ops.mesh.primitive_plane_add()
-elif obj_type == "MONKEY":
-    bpy.ops.mesh.primitive_monkey_add()
-elif obj_type == "CAMERA":
-    bpy.ops.object.camera_add()
-elif obj_type == "LIGHT":
-    bpy.ops.object.light_add(type='POINT')
-
-obj = bpy.context.active_object
-obj.name = "{name}"
-obj.location = {loc}
-obj.rotation_euler = {rot}
-obj.scale = {scale}
-
-print(f"Created {{obj_type}}: {{obj.name}} at {{obj.location}}")
-'''
-                    result = await self._send_command("execute_code", {"code": code})
-                    return [
-                        TextContent(
-                            type="text", text=f"Object created successfully\n{result}"
-                        )
-                    ]
-
-                elif name == "modify_object":
-                    obj_name = arguments["object_name"]
-                    modifications = []
-
-                    code_parts = [
-                        f'import bpy\nobj = bpy.data.objects.get("{obj_name}")\nif not obj:\n    print("ERROR: Object not found")\nelse:'
-                    ]
-
-                    if "location" in arguments:
-                        code_parts.append(f"    obj.location = {arguments['location']}")
-                        modifications.append("location")
-                    if "rotation" in arguments:
-                        code_parts.append(
-                            f"    obj.rotation_euler = {arguments['rotation']}"
-                        )
-                        modifications.append("rotation")
-                    if "scale" in arguments:
-                        code_parts.append(f"    obj.scale = {arguments['scale']}")
-                        modifications.append("scale")
-                    if "visible" in arguments:
-                        code_parts.append(
-                            f"    obj.hide_set({not arguments['visible']})"
-                        )
-                        modifications.append("visibility")
-
-                    code_parts.append(
-                        f'    print("Modified {obj_name}: {", ".join(modifications)}")'
-                    )
-                    code = "\n".join(code_parts)
-
-                    result = await self._send_command("execute_code", {"code": code})
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "delete_object":
-                    obj_name = arguments["object_name"]
-                    code = f'''
-import bpy
-obj = bpy.data.objects.get("{obj_name}")
-if obj:
-    bpy.data.objects.remove(obj, do_unlink=True)
-    print(f"Deleted object: {obj_name}")
-else:
-    print(f"ERROR: Object not found: {obj_name}")
-'''
-                    result = await self._send_command("execute_code", {"code": code})
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "select_objects":
-                    obj_names = arguments["object_names"]
-                    deselect_all = arguments.get("deselect_all", True)
-
-                    code = f"""
-import bpy
-
-if {deselect_all}:
-    bpy.ops.object.select_all(action='DESELECT')
-
-selected = []
-for name in {obj_names}:
-    obj = bpy.data.objects.get(name)
-    if obj:
-        obj.select_set(True)
-        selected.append(name)
-    else:
-        print(f"WARNING: Object not found: {{name}}")
+                return await handler(arguments)
+            except OSError as e:
+                return _err(f"Blender connection failed: {e}")
+            except KeyError as e:
+                return _err(f"Missing argument: {e}")
+
+    async def _handle_get_scene_info(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Return a summary of the current scene"""
+        result = await self._send_command("get_scene_info", {})
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_get_viewport_screenshot(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Capture an editor area and return it as a PNG image"""
+        max_size = arguments.get("max_size", 800)
+        area_type = arguments.get("area_type", "VIEW_3D")
+        result = await self._send_command(
+            "get_viewport_screenshot", {"max_size": max_size, "area_type": area_type}
+        )
+        if result:
+            return [
+                TextContent(
+                    type="text",
+                    text=f"{area_type} screenshot captured ({max_size}px max)",
+                ),
+                ImageContent(
+                    type="image",
+                    data=base64.b64encode(result).decode("ascii"),
+                    mimeType="image/png",
+                ),
+            ]
+        else:
+            return [
+                TextContent(
+                    type="text",
+                    text="Screenshot failed: no image data returned",
+                )
+            ]
 
-if selected:
-    bpy.context.view_layer.objects.active = bpy.data.objects[selected[0]]
+    async def _handle_get_object_info(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Return detailed information about a single object"""
+        result = await self._send_command(
+            "get_object_info", {"name": arguments["object_name"]}
+        )
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_execute_python(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Run arbitrary Python code inside Blender"""
+        params = {"code": arguments["code"]}
+        if "capture_output" in arguments:
+            params["capture_output"] = arguments["capture_output"]
+        result = await self._send_command("execute_code", params)
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_create_object(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for create_object"""
+        obj_type = arguments["object_type"]
+        return "create_primitive", {
+            "object_type": obj_type,
+            "name": arguments.get("name", obj_type.lower()),
+            "location": _vec3(arguments.get("location", _ZERO3)),
+            "rotation": _vec3(arguments.get("rotation", _ZERO3)),
+            "scale": _vec3(arguments.get("scale", _ONE3)),
+        }
+
+    async def _handle_create_object(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Create a primitive, camera or light"""
+        result = await self._send_command(*self._command_create_object(arguments))
+        return [
+            TextContent(
+                type="text",
+                text=f"Object created successfully\n{_dumps(result)}",
+            )
+        ]
+
+    def _command_modify_object(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for modify_object"""
+        params = {"object_name": arguments["object_name"]}
+        for key in ("location", "rotation", "scale"):
+            if key in arguments:
+                params[key] = _vec3(arguments[key])
+        if "visible" in arguments:
+            params["visible"] = arguments["visible"]
+        return "modify_object", params
+
+    async def _handle_modify_object(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Update an object's transform or visibility"""
+        result = await self._send_command(*self._command_modify_object(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_delete_object(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for delete_object"""
+        return "delete_object", {"object_name": arguments["object_name"]}
+
+    async def _handle_delete_object(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Delete an object from the scene"""
+        result = await self._send_command(*self._command_delete_object(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_select_objects(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for select_objects"""
+        return "select_objects", {
+            "object_names": arguments["object_names"],
+            "deselect_all": arguments.get("deselect_all", True),
+        }
+
+    async def _handle_select_objects(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Select objects by name"""
+        result = await self._send_command(*self._command_select_objects(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_render_image(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Render the scene and return the image"""
+        params = {
+            "resolution_x": arguments.get("resolution_x", 1920),
+            "resolution_y": arguments.get("resolution_y", 1080),
+            "samples": arguments.get("samples", 128),
+        }
+        result = await self._send_command("render_image", params)
+
+        if result:
+            return [
+                ImageContent(
+                    type="image",
+                    data=base64.b64encode(result).decode("ascii"),
+                    mimeType="image/png",
+                )
+            ]
+        else:
+            return [
+                TextContent(type="text", text="Render failed: no image data returned")
+            ]
 
-print(f"Selected {{len(selected)}} objects: {{selected}}")
-"""
-                    result = await self._send_command("execute_code", {"code": code})
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "render_image":
-                    res_x = arguments.get("resolution_x", 1920)
-                    res_y = arguments.get("resolution_y", 1080)
-                    samples = arguments.get("samples", 128)
-
-                    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-                    temp_path = temp_file.name
-                    temp_file.close()
-
-                    code = f'''
-import bpy
-
-# Save current settings
-old_res_x = bpy.context.scene.render.resolution_x
-old_res_y = bpy.context.scene.render.resolution_y
-old_samples = bpy.context.scene.cycles.samples if bpy.context.scene.render.engine == 'CYCLES' else None
-
-# Set render settings
-bpy.context.scene.render.resolution_x = {res_x}
-bpy.context.scene.render.resolution_y = {res_y}
-bpy.context.scene.render.filepath = "{temp_path}"
-bpy.context.scene.render.image_settings.file_format = 'PNG'
-
-if bpy.context.scene.render.engine == 'CYCLES':
-    bpy.context.scene.cycles.samples = {samples}
-
-# Render
-bpy.ops.render.render(write_still=True)
-
-# Restore settings
-bpy.context.scene.render.resolution_x = old_res_x
-bpy.context.scene.render.resolution_y = old_res_y
-if old_samples:
-    bpy.context.scene.cycles.samples = old_samples
-
-print("Render complete: {temp_path}")
-'''
-                    result = await self._send_command("execute_code", {"code": code})
-
-                    # Read rendered image
-                    if os.path.exists(temp_path) and os.path.getsize(temp_path) > 0:
-                        with open(temp_path, "rb") as f:
-                            image_data = base64.b64encode(f.read()).decode("utf-8")
-                        os.unlink(temp_path)
-
-                        return [
-                            ImageContent(
-                                type="image",
-                                data=image_data,
-                                mimeType="image/png",
-                            )
-                        ]
-                    else:
-                        if os.path.exists(temp_path):
-                            os.unlink(temp_path)
-                        return [
-                            TextContent(type="text", text=f"Render failed: {result}")
-                        ]
-
-                elif name == "get_modifiers":
-                    result = await self._send_command(
-                        "get_modifiers",
-                        {
-                            "object_name": arguments["object_name"],
-                        },
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "add_modifier":
-                    params = {
-                        "object_name": arguments["object_name"],
-                        "modifier_type": arguments["modifier_type"],
-                    }
-                    if "modifier_name" in arguments:
-                        params["modifier_name"] = arguments["modifier_name"]
-                    if "properties" in arguments:
-                        params["properties"] = arguments["properties"]
-                    result = await self._send_command("add_modifier", params)
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "remove_modifier":
-                    result = await self._send_command(
-                        "remove_modifier",
-                        {
-                            "object_name": arguments["object_name"],
-                            "modifier_name": arguments["modifier_name"],
-                        },
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "apply_modifier":
-                    result = await self._send_command(
-                        "apply_modifier",
-                        {
-                            "object_name": arguments["object_name"],
-                            "modifier_name": arguments["modifier_name"],
-                        },
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "set_geometry_nodes_input":
-                    result = await self._send_command(
-                        "set_geometry_nodes_input",
-                        {
-                            "object_name": arguments["object_name"],
-                            "modifier_name": arguments["modifier_name"],
-                            "input_name": arguments["input_name"],
-                            "value": arguments["value"],
-                        },
-                    )
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "list_asset_libraries":
-                    result = await self._send_command("get_asset_libraries", {})
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "list_assets":
-                    params = {
-                        "library_name": arguments["library_name"],
-                        "search": arguments.get("search", ""),
-                        "offset": arguments.get("offset", 0),
-                        "limit": arguments.get("limit", 50),
-                    }
-                    result = await self._send_command("list_assets", params)
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                elif name == "add_asset_to_scene":
-                    params = {
-                        "library_name": arguments["library_name"],
-                        "asset_name": arguments["asset_name"],
-                        "location": arguments.get("location", [0, 0, 0]),
-                    }
-                    result = await self._send_command("append_asset", params)
-                    return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-                else:
-                    return [TextContent(type="text", text=f"Unknown tool: {name}")]
-
-            except Exception as e:
-                return [TextContent(type="text", text=f"Error: {str(e)}")]
+    async def _handle_get_modifiers(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """List the modifiers on an object"""
+        result = await self._send_command(
+            "get_modifiers",
+            {
+                "object_name": arguments["object_name"],
+            },
+        )
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_add_modifier(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for add_modifier"""
+        params = {
+            "object_name": arguments["object_name"],
+            "modifier_type": arguments["modifier_type"],
+        }
+        if "modifier_name" in arguments:
+            params["modifier_name"] = arguments["modifier_name"]
+        if "properties" in arguments:
+            params["properties"] = arguments["properties"]
+        return "add_modifier", params
+
+    async def _handle_add_modifier(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Add a modifier to an object"""
+        result = await self._send_command(*self._command_add_modifier(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_remove_modifier(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for remove_modifier"""
+        return "remove_modifier", {
+            "object_name": arguments["object_name"],
+            "modifier_name": arguments["modifier_name"],
+        }
+
+    async def _handle_remove_modifier(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Remove a modifier from an object"""
+        result = await self._send_command(*self._command_remove_modifier(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_apply_modifier(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for apply_modifier"""
+        return "apply_modifier", {
+            "object_name": arguments["object_name"],
+            "modifier_name": arguments["modifier_name"],
+        }
+
+    async def _handle_apply_modifier(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Apply a modifier to an object"""
+        result = await self._send_command(*self._command_apply_modifier(arguments))
+        return [TextContent(type="text", text=_dumps(result))]
+
+    def _command_set_geometry_nodes_input(self, arguments: dict) -> tuple[str, dict]:
+        """Build the addon command for set_geometry_nodes_input"""
+        return "set_geometry_nodes_input", {
+            "object_name": arguments["object_name"],
+            "modifier_name": arguments["modifier_name"],
+            "input_name": arguments["input_name"],
+            "value": arguments["value"],
+        }
+
+    async def _handle_set_geometry_nodes_input(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Set an input on a Geometry Nodes modifier"""
+        result = await self._send_command(
+            *self._command_set_geometry_nodes_input(arguments)
+        )
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_batch(self, arguments: dict) -> list[TextContent | ImageContent]:
+        """Run several tool operations in a single round trip"""
+        tools = []
+        ops = []
+        for index, operation in enumerate(arguments["operations"]):
+            tool = operation["tool"]
+            tool_args = operation.get("arguments", {})
+            error = jsonschema.exceptions.best_match(
+                _VALIDATORS[tool].iter_errors(tool_args)
+            )
+            if error is not None:
+                raise ValueError(
+                    f"Input validation error in operation {index} "
+                    f"({tool}): {error.message}"
+                )
+            cmd_type, params = self._batch_commands[tool](tool_args)
+            tools.append(tool)
+            ops.append({"type": cmd_type, "params": params})
+
+        responses = await self._send_command("batch", {"ops": ops})
+        results = [
+            {"tool": tool, **response} for tool, response in zip(tools, responses)
+        ]
+        # Blender stops at the first failed operation; report it as a tool
+        # error along with the operations that already succeeded
+        if results and results[-1].get("status") == "error":
+            failed = results.pop()
+            raise BlenderCommandError(
+                f"Operation {len(results)} ({failed['tool']}) failed: "
+                f"{failed.get('message', 'Unknown error')}. "
+                f"Completed operations: {_dumps(results)}"
+            )
+        return [TextContent(type="text", text=_dumps(results))]
+
+    async def _handle_list_asset_libraries(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """List the configured asset libraries"""
+        result = await self._send_command("get_asset_libraries", {})
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_list_assets(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """List or search assets in a library"""
+        params = {
+            "library_name": arguments["library_name"],
+            "search": arguments.get("search", ""),
+            "offset": arguments.get("offset", 0),
+            "limit": arguments.get("limit", 50),
+        }
+        result = await self._send_command("list_assets", params)
+        return [TextContent(type="text", text=_dumps(result))]
+
+    async def _handle_add_asset_to_scene(
+        self, arguments: dict
+    ) -> list[TextContent | ImageContent]:
+        """Append a library asset into the scene"""
+        params = {
+            "library_name": arguments["library_name"],
+            "asset_name": arguments["asset_name"],
+            "location": _vec3(arguments.get("location", _ZERO3)),
+        }
+        result = await self._send_command("append_asset", params)
+        return [TextContent(type="text", text=_dumps(result))]
 
     async def _send_command(self, cmd_type: str, params: dict) -> dict:
         """Send a command to the Blender socket server"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(
-            None, self._send_command_sync, cmd_type, params
-        )
-
-    def _send_command_sync(self, cmd_type: str, params: dict) -> dict:
-        """Send a command to the Blender socket server (blocking)"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(30.0)
-        try:
-            sock.connect((self.host, self.port))
-
-            command = {
-                "type": cmd_type,
-                "params": params,
-            }
-            sock.sendall(json.dumps(command).encode("utf-8"))
-
-            response_data = b""
-            while True:
-                chunk = sock.recv(8192)
-                if not chunk:
-                    break
-                response_data += chunk
-                try:
-                    response = json.loads(response_data.decode("utf-8"))
-                    break
-                except json.JSONDecodeError:
-                    continue
-
-            if not response_data:
-                raise Exception("Connection closed without response")
-
+        command = {
+            "type": cmd_type,
+            "params": params,
+        }
+        if _decode_msgpack is not None:
+            command["accept"] = "msgpack"
+        payload = _encode(command)
+
+        async with self._io_lock:
             try:
-                response = json.loads(response_data.decode("utf-8"))
-            except json.JSONDecodeError:
-                raise Exception(f"Invalid JSON response: {response_data[:200]}")
+                response = await asyncio.wait_for(
+                    self._roundtrip(payload), timeout=_TIMEOUT
+                )
+            except asyncio.CancelledError:
+                # The response may still arrive later; drop the connection so
+                # it is not mistaken for the reply to the next command.
+                self._close()
+                raise
+            except asyncio.TimeoutError:
+                self._close()
+                raise TimeoutError(
+                    f"Blender did not respond within {_TIMEOUT:g} seconds"
+                )
+            except Exception:
+                # Connection errors (OSError) and bad replies (BlenderCommError)
+                # keep their type so callers can tell them apart.
+                self._close()
+                raise
+
+        if response.get("status") == "error":
+            message = response.get("message", "Unknown error")
+            raise BlenderCommandError(message)
+
+        return response.get("result", {})
+
+    async def _roundtrip(self, payload: bytes) -> dict:
+        """Write one framed command and read its framed response"""
+        frame = _HEADER.pack(_JSON, len(payload)) + payload
+        # Blender may have closed the idle connection (e.g. the addon server
+        # was restarted); its EOF has already been seen, so open a new one.
+        if self._writer is not None and self._reader.at_eof():
+            self._close()
+
+        reused = self._writer is not None
+        if not reused:
+            await self._connect()
+        try:
+            self._writer.write(frame)
+            await self._writer.drain()
+        except ConnectionError:
+            if not reused:
+                raise
+            # The write itself failed, so Blender never got the command and
+            # it is safe to send it once more. A connection that drops after
+            # the write is never retried: the command may already have run.
+            self._close()
+            await self._connect()
+            self._writer.write(frame)
+            await self._writer.drain()
 
-            if response.get("status") == "error":
-                raise Exception(response.get("message", "Unknown error"))
+        try:
+            header = await self._reader.readexactly(_HEADER.size)
+            content_type, length = _HEADER.unpack(header)
+            response_data = await self._reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            raise ConnectionError("Connection closed without response")
+
+        if content_type == _BINARY:
+            return {"status": "success", "result": response_data}
+        if content_type == _JSON:
+            decode = _decode
+        elif content_type == _MSGPACK and _decode_msgpack is not None:
+            decode = _decode_msgpack
+        else:
+            raise BlenderCommError(f"Unsupported response content type: {content_type}")
 
-            return response.get("result", {})
+        try:
+            return decode(response_data)
+        except _DecodeError as e:
+            raise BlenderCommError(f"Invalid response: {response_data[:200]}") from e
+
+    async def _connect(self):
+        """Open the connection to Blender and tune its socket"""
+        # The stream reader pauses the socket whenever its buffer passes twice
+        # the limit; the 64 KiB default makes a large reply stop and resume
+        # reading many times, so let it buffer as much as the kernel does.
+        if self.socket_path:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.socket_path, limit=_RECV_BUFFER_SIZE
+            )
+            return
 
-        except Exception as e:
-            raise Exception(f"Failed to communicate with Blender: {str(e)}")
-        finally:
-            sock.close()
+        self._reader, self._writer = await asyncio.open_connection(
+            self.host, self.port, limit=_RECV_BUFFER_SIZE
+        )
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            # Commands are small request/response messages, so never let
+            # Nagle's algorithm hold one back waiting for an ACK.
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # The connection is kept open between commands; let the OS probe it
+            # so a peer that went away is noticed.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_SIZE)
+
+    def _close(self):
+        """Close the connection to Blender, if one is open"""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _warmup(self):
+        """Connect to Blender ahead of the first tool call"""
+        async with self._io_lock:
+            if self._writer is not None:
+                return
+            try:
+                await asyncio.wait_for(self._connect(), timeout=_TIMEOUT)
+            except (OSError, asyncio.TimeoutError) as e:
+                # Blender may simply not be running yet; the first tool call
+                # will try again.
+                self._close()
+                print(f"Could not connect to Blender yet: {e!r}", file=sys.stderr)
 
     async def run(self):
         """Run the MCP server"""
         async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream, write_stream, self.server.create_initialization_options()
-            )
+            # Connect in the background so the first tool call does not pay
+            # for it, without delaying the MCP handshake.
+            warmup = asyncio.create_task(self._warmup())
+            try:
+                await self.server.run(read_stream, write_stream, self._init_opts)
+            finally:
+                warmup.cancel()
 
 
 async def main():
     """Main entry point"""
     host = os.environ.get("BLENDER_HOST", "localhost")
     port = int(os.environ.get("BLENDER_PORT", "9876"))
+    socket_path = os.environ.get("BLENDER_SOCK") or None
 
-    server = BlenderMCPServer(host=host, port=port)
+    server = BlenderMCPServer(host=host, port=port, socket_path=socket_path)
     await server.run()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; it is a faster drop-in for the asyncio event loop.
+    # uvloop.run() only exists from uvloop 0.18, so older releases fall back
+    # to installing its event loop policy.
+    if uvloop is not None and getattr(uvloop, "run", None) is not None:
+        uvloop.run(main())
+    else:
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        asyncio.run(main())
@@ -11,16 +11,34 @@ Installation:
 """
 
 import bpy
+import gpu
 import json
 import os
+import selectors
 import socket
+import stat
+import struct
+import tempfile
 import threading
 import time
 import traceback
 import io
+import zlib
+import numpy as np
 from contextlib import redirect_stdout
+from functools import lru_cache
 from bpy.props import IntProperty, BoolProperty, StringProperty
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 bl_info = {
     "name": "Blender MCP",
     "author": "Tonis",
@@ -31,16 +49,141 @@ bl_info = {
     "category": "Interface",
 }
 
+# Messages to and from the MCP server are framed as a content type byte and
+# a 4-byte big-endian payload length, followed by the payload.
+_HEADER = struct.Struct(">BI")
+
+# Frame content types. Commands are always JSON; responses are MessagePack
+# when the command accepts it and the msgpack package is installed. Handlers
+# that produce an image return its raw bytes, which are sent as a binary
+# frame instead of base64 inside JSON.
+_JSON = 1
+_MSGPACK = 2
+_BINARY = 3
+
+# JSON codec for frames. orjson is optional; when it is installed it encodes
+# straight to bytes, and its JSONDecodeError subclasses json.JSONDecodeError.
+if orjson is not None:
+    _encode = orjson.dumps
+    _decode = orjson.loads
+else:
+
+    def _encode(obj):
+        """Encode a message for the MCP server"""
+        return json.dumps(obj).encode("utf-8")
+
+    _decode = json.loads
+
+# Operator and arguments used by create_primitive, keyed by object type
+_PRIMITIVE_OPS = {
+    "CUBE": (bpy.ops.mesh.primitive_cube_add, {}),
+    "SPHERE": (bpy.ops.mesh.primitive_uv_sphere_add, {}),
+    "CYLINDER": (bpy.ops.mesh.primitive_cylinder_add, {}),
+    "CONE": (bpy.ops.mesh.primitive_cone_add, {}),
+    "TORUS": (bpy.ops.mesh.primitive_torus_add, {}),
+    "PLANE": (bpy.ops.mesh.primitive_plane_add, {}),
+    "MONKEY": (bpy.ops.mesh.primitive_monkey_add, {}),
+    "CAMERA": (bpy.ops.object.camera_add, {}),
+    "LIGHT": (bpy.ops.object.light_add, {"type": "POINT"}),
+}
+
+# Properties reported by get_modifiers, keyed by modifier type
+_MODIFIER_PROPERTIES = {
+    "SUBSURF": ("levels", "render_levels", "uv_smooth", "quality"),
+    "BEVEL": ("width", "segments", "limit_method", "offset_type"),
+    "ARRAY": (
+        "count",
+        "use_relative_offset",
+        "use_constant_offset",
+        "relative_offset_displace",
+        "constant_offset_displace",
+    ),
+    "MIRROR": ("use_axis", "use_bisect_axis", "merge_threshold"),
+    "BOOLEAN": ("operation", "solver"),
+    "SOLIDIFY": ("thickness", "offset", "use_even_offset"),
+    "WIREFRAME": ("thickness", "use_replace", "use_even_offset"),
+    "DECIMATE": ("decimate_type", "ratio", "angle_limit"),
+    "REMESH": ("mode", "octree_depth", "voxel_size"),
+    "SMOOTH": ("factor", "iterations"),
+    "SHRINKWRAP": ("wrap_method", "wrap_mode", "offset"),
+    "CURVE": ("deform_axis",),
+}
+
+# File name suffix of asset library files
+_BLEND_SUFFIX = ".blend"
+
+# Seconds a list_assets result is reused, so paging through one listing
+# does not walk the library again for every page
+_ASSET_PAGE_TTL = 5.0
+
+# Sentinel for properties a modifier does not have
+_MISSING = object()
+
+
+# Kernel send buffer for client connections; screenshots, renders and
+# scene listings are much larger than the commands that request them
+_SEND_BUFFER_SIZE = 1024 * 1024
+
+# MCP servers keep one connection open per session; refuse connections
+# beyond this many instead of starting a handler thread for each
+_MAX_CLIENTS = 8
+
+
+@lru_cache(maxsize=128)
+def _compile_code(code):
+    """Compile execute_code source, reusing the result for repeated snippets"""
+    return compile(code, "<string>", "exec")
+
 
 class BlenderMCPServer:
     """Simple socket server for Blender MCP communication"""
 
-    def __init__(self, host="localhost", port=9876):
+    # Commands the MCP server may send; each is handled by the method of the
+    # same name
+    _COMMANDS = frozenset(
+        {
+            "get_scene_info",
+            "get_object_info",
+            "get_viewport_screenshot",
+            "execute_code",
+            "create_primitive",
+            "modify_object",
+            "delete_object",
+            "select_objects",
+            "render_image",
+            "get_asset_libraries",
+            "list_assets",
+            "append_asset",
+            "get_modifiers",
+            "add_modifier",
+            "remove_modifier",
+            "apply_modifier",
+            "set_geometry_nodes_input",
+            "batch",
+        }
+    )
+
+    def __init__(self, host="localhost", port=9876, socket_path=""):
         self.host = host
         self.port = port
+        # When set, listen on this Unix socket instead of host/port
+        self.socket_path = socket_path
         self.running = False
         self.socket = None
         self.server_thread = None
+        # Library path -> {asset folder name: (folder st_mtime_ns, .blend file
+        # name or None)} from the last scan
+        self._asset_scans = {}
+        # (library path, lowercased search) -> (monotonic expiry, matching
+        # assets) for paging through list_assets results
+        self._asset_pages = {}
+        self._client_slots = threading.BoundedSemaphore(_MAX_CLIENTS)
+        # Open client connections, closed by stop() so a stopped server never
+        # reads or runs another command from them
+        self._clients = set()
+        # Socket pair that stop() writes to so the server loop wakes up
+        self._wakeup_recv = None
+        self._wakeup_send = None
 
     def start(self):
         if self.running:
@@ -51,17 +194,28 @@ class BlenderMCPServer:
 
         try:
             # Create socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, self.port))
+            if self.socket_path:
+                self._remove_stale_socket()
+                self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.socket.bind(self.socket_path)
+                address = self.socket_path
+            else:
+                self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self.socket.bind((self.host, self.port))
+                address = f"{self.host}:{self.port}"
             self.socket.listen(1)
+            # accept() only runs once the selector reports a pending
+            # connection; non-blocking covers a client that left in between
+            self.socket.setblocking(False)
+            self._wakeup_recv, self._wakeup_send = socket.socketpair()
 
             # Start server thread
             self.server_thread = threading.Thread(target=self._server_loop)
             self.server_thread.daemon = True
             self.server_thread.start()
 
-            print(f"BlenderMCP: Server started on {self.host}:{self.port}")
+            print(f"BlenderMCP: Server started on {address}")
         except Exception as e:
             print(f"BlenderMCP: Failed to start server: {str(e)}")
             self.stop()
@@ -69,13 +223,12 @@ class BlenderMCPServer:
     def stop(self):
         self.running = False
 
-        # Close socket
-        if self.socket:
+        # Wake the server loop so it returns right away
+        if self._wakeup_send:
             try:
-                self.socket.close()
-            except:
+                self._wakeup_send.send(b"\0")
+            except OSError:
                 pass
-            self.socket = None
 
         # Wait for thread
         if self.server_thread:
@@ -86,87 +239,226 @@ class BlenderMCPServer:
                 pass
             self.server_thread = None
 
+        # Close client connections; shutdown() also wakes handler threads
+        # blocked in recv
+        clients = list(self._clients)
+        self._clients.clear()
+        for client in clients:
+            try:
+                client.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            client.close()
+
+        # Close socket
+        if self.socket:
+            try:
+                self.socket.close()
+            except:
+                pass
+            self.socket = None
+            if self.socket_path:
+                self._remove_stale_socket()
+
+        for sock in (self._wakeup_recv, self._wakeup_send):
+            if sock:
+                sock.close()
+        self._wakeup_recv = self._wakeup_send = None
+
         print("BlenderMCP: Server stopped")
 
+    def _remove_stale_socket(self):
+        """Delete a socket file left at socket_path by an earlier session"""
+        try:
+            if not stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                return
+        except OSError:
+            return
+        # Only a socket nobody is listening on is stale; a live one belongs to
+        # another Blender instance and is left for bind() to report
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(1.0)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+        except OSError:
+            pass
+        finally:
+            probe.close()
+
     def _server_loop(self):
         """Main server loop"""
-        self.socket.settimeout(1.0)
+        # Block until a client connects or stop() writes to the wakeup socket,
+        # rather than polling accept() with a timeout
+        selector = selectors.DefaultSelector()
+        selector.register(self.socket, selectors.EVENT_READ)
+        selector.register(self._wakeup_recv, selectors.EVENT_READ)
 
-        while self.running:
-            try:
+        try:
+            while self.running:
                 try:
-                    client, address = self.socket.accept()
-                    print(f"BlenderMCP: Client connected from {address}")
-
-                    # Handle in separate thread
-                    client_thread = threading.Thread(
-                        target=self._handle_client, args=(client,)
-                    )
-                    client_thread.daemon = True
-                    client_thread.start()
-                except socket.timeout:
-                    continue
+                    for key, _ in selector.select():
+                        if key.fileobj is self._wakeup_recv:
+                            return
+                        try:
+                            client, address = self.socket.accept()
+                        except BlockingIOError:
+                            continue
+                        except Exception as e:
+                            if self.running:
+                                print(
+                                    f"BlenderMCP: Error accepting connection: {str(e)}"
+                                )
+                            time.sleep(0.5)
+                            continue
+
+                        if not self._client_slots.acquire(blocking=False):
+                            print(
+                                f"BlenderMCP: Refusing connection from {address}, "
+                                f"{_MAX_CLIENTS} clients already connected"
+                            )
+                            client.close()
+                            continue
+                        print(f"BlenderMCP: Client connected from {address}")
+
+                        # Handle in separate thread
+                        client_thread = threading.Thread(
+                            target=self._handle_client, args=(client,)
+                        )
+                        client_thread.daemon = True
+                        try:
+                            client_thread.start()
+                        except Exception:
+                            # The handler never ran, so its finally will not
+                            # release the slot or close the socket
+                            client.close()
+                            self._client_slots.release()
+                            raise
                 except Exception as e:
                     if self.running:
-                        print(f"BlenderMCP: Error accepting connection: {str(e)}")
+                        print(f"BlenderMCP: Error in server loop: {str(e)}")
                     time.sleep(0.5)
-            except Exception as e:
-                if self.running:
-                    print(f"BlenderMCP: Error in server loop: {str(e)}")
-                time.sleep(0.5)
+        finally:
+            selector.close()
 
     def _handle_client(self, client):
         """Handle client connection"""
-        client.settimeout(None)
-        buffer = b""
-
+        # Everything after the slot was taken runs under the finally below,
+        # so a connection that fails early still gives its slot back
         try:
+            self._clients.add(client)
+            try:
+                client.settimeout(None)
+                if not self.socket_path:
+                    # Replies are written in one sendall; never let Nagle's
+                    # algorithm hold back the last segment waiting for an ACK
+                    client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                    client.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE
+                    )
+            except OSError as e:
+                print(f"BlenderMCP: Error setting up connection: {str(e)}")
+                return
+
             while self.running:
                 try:
-                    data = client.recv(8192)
-                    if not data:
+                    header = self._recv_exact(client, _HEADER.size)
+                    if header is None:
+                        break
+                    content_type, length = _HEADER.unpack(header)
+                    data = self._recv_exact(client, length)
+                    if data is None:
                         break
-
-                    buffer += data
-                    try:
-                        command = json.loads(buffer.decode("utf-8"))
-                        buffer = b""
-
-                        # Execute in main thread
-                        def execute_wrapper():
-                            try:
-                                response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode("utf-8"))
-                                except:
-                                    pass
-                            except Exception as e:
-                                print(f"BlenderMCP: Error executing command: {str(e)}")
-                                traceback.print_exc()
-                                try:
-                                    error_response = {
-                                        "status": "error",
-                                        "message": str(e),
-                                    }
-                                    client.sendall(
-                                        json.dumps(error_response).encode("utf-8")
-                                    )
-                                except:
-                                    pass
-                            return None
-
-                        bpy.app.timers.register(execute_wrapper, first_interval=0.0)
-                    except json.JSONDecodeError:
-                        pass
                 except Exception as e:
-                    print(f"BlenderMCP: Error receiving data: {str(e)}")
+                    if self.running:
+                        print(f"BlenderMCP: Error receiving data: {str(e)}")
+                    break
+
+                # stop() ran while this frame was arriving
+                if not self.running:
                     break
+
+                if content_type != _JSON:
+                    self._send_response(
+                        client,
+                        {
+                            "status": "error",
+                            "message": f"Unsupported content type: {content_type}",
+                        },
+                    )
+                    continue
+
+                try:
+                    command = _decode(data)
+                except json.JSONDecodeError as e:
+                    self._send_response(
+                        client,
+                        {"status": "error", "message": f"Invalid JSON command: {e}"},
+                    )
+                    continue
+
+                use_msgpack = msgpack is not None and command.get("accept") == "msgpack"
+
+                # Execute in main thread
+                def execute_wrapper(command=command, use_msgpack=use_msgpack):
+                    # The timer can fire after stop() closed this connection;
+                    # the client will not read a reply, so do not run it
+                    if client not in self._clients:
+                        return None
+                    try:
+                        response = self.execute_command(command)
+                        self._send_response(client, response, use_msgpack)
+                    except Exception as e:
+                        print(f"BlenderMCP: Error executing command: {str(e)}")
+                        traceback.print_exc()
+                        self._send_response(
+                            client, {"status": "error", "message": str(e)}, use_msgpack
+                        )
+                    return None
+
+                bpy.app.timers.register(execute_wrapper, first_interval=0.0)
         finally:
+            self._clients.discard(client)
             try:
                 client.close()
             except:
                 pass
+            self._client_slots.release()
+
+    def _recv_exact(self, client, size):
+        """Read exactly size bytes, or return None if the client disconnects"""
+        # The frame header gives the exact size, so receive straight into a
+        # buffer of that size instead of accumulating chunks.
+        data = bytearray(size)
+        view = memoryview(data)
+        offset = 0
+        while offset < size:
+            received = client.recv_into(view[offset:])
+            if not received:
+                return None
+            offset += received
+        return data
+
+    def _send_response(self, client, response, use_msgpack=False):
+        """Send a framed response to the client"""
+        result = response.get("result")
+        if isinstance(result, bytes):
+            content_type = _BINARY
+            payload = result
+        elif use_msgpack:
+            content_type = _MSGPACK
+            payload = msgpack.packb(response)
+        else:
+            content_type = _JSON
+            payload = _encode(response)
+        try:
+            client.sendall(_HEADER.pack(content_type, len(payload)) + payload)
+        except:
+            pass
 
     def execute_command(self, command):
         """Execute a command"""
@@ -174,24 +466,8 @@ class BlenderMCPServer:
             cmd_type = command.get("type")
             params = command.get("params", {})
 
-            handlers = {
-                "get_scene_info": self.get_scene_info,
-                "get_object_info": self.get_object_info,
-                "get_viewport_screenshot": self.get_viewport_screenshot,
-                "execute_code": self.execute_code,
-                "get_asset_libraries": self.get_asset_libraries,
-                "list_assets": self.list_assets,
-                "append_asset": self.append_asset,
-                "get_modifiers": self.get_modifiers,
-                "add_modifier": self.add_modifier,
-                "remove_modifier": self.remove_modifier,
-                "apply_modifier": self.apply_modifier,
-                "set_geometry_nodes_input": self.set_geometry_nodes_input,
-            }
-
-            handler = handlers.get(cmd_type)
-            if handler:
-                result = handler(**params)
+            if cmd_type in self._COMMANDS:
+                result = getattr(self, cmd_type)(**params)
                 return {"status": "success", "result": result}
             else:
                 return {"status": "error", "message": f"Unknown command: {cmd_type}"}
@@ -201,27 +477,35 @@ class BlenderMCPServer:
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
 
+    def batch(self, ops):
+        """Run several commands in one main-thread tick, stopping at the first error"""
+        responses = []
+        for op in ops:
+            response = self.execute_command(op)
+            responses.append(response)
+            if response["status"] == "error":
+                break
+        return responses
+
     def get_scene_info(self):
         """Get scene information"""
+        scene = bpy.context.scene
+        objects = scene.objects
         scene_info = {
-            "name": bpy.context.scene.name,
-            "object_count": len(bpy.context.scene.objects),
+            "name": scene.name,
+            "object_count": len(objects),
             "objects": [],
             "materials_count": len(bpy.data.materials),
         }
 
-        for i, obj in enumerate(bpy.context.scene.objects):
-            if i >= 20:
-                break
-
+        # Only the first 20 objects are listed. Unpacking the location reads
+        # the vector once instead of going through RNA for each component.
+        for obj in objects[:20]:
+            x, y, z = obj.location
             obj_info = {
                 "name": obj.name,
                 "type": obj.type,
-                "location": [
-                    round(float(obj.location.x), 2),
-                    round(float(obj.location.y), 2),
-                    round(float(obj.location.z), 2),
-                ],
+                "location": [round(x, 2), round(y, 2), round(z, 2)],
             }
             scene_info["objects"].append(obj_info)
 
@@ -236,21 +520,17 @@ class BlenderMCPServer:
         obj_info = {
             "name": obj.name,
             "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [
-                obj.rotation_euler.x,
-                obj.rotation_euler.y,
-                obj.rotation_euler.z,
-            ],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "location": list(obj.location),
+            "rotation": list(obj.rotation_euler),
+            "scale": list(obj.scale),
             "visible": obj.visible_get(),
-            "materials": [],
+            "materials": [
+                material.name
+                for material in (slot.material for slot in obj.material_slots)
+                if material
+            ],
         }
 
-        for slot in obj.material_slots:
-            if slot.material:
-                obj_info["materials"].append(slot.material.name)
-
         if obj.type == "MESH" and obj.data:
             mesh = obj.data
             obj_info["mesh"] = {
@@ -261,36 +541,127 @@ class BlenderMCPServer:
 
         return obj_info
 
-    def get_viewport_screenshot(self, max_size=800, area_type="VIEW_3D"):
-        """Capture screenshot of a specific editor area and return as base64"""
-        import tempfile
-        import base64
-        import os
+    def create_primitive(
+        self,
+        object_type,
+        name=None,
+        location=(0, 0, 0),
+        rotation=(0, 0, 0),
+        scale=(1, 1, 1),
+    ):
+        """Create a mesh primitive, camera or light"""
+        ops = _PRIMITIVE_OPS.get(object_type)
+        if ops is None:
+            raise ValueError(f"Unsupported object type: {object_type}")
+        operator, op_args = ops
+        operator(**op_args)
+
+        obj = bpy.context.active_object
+        if name:
+            obj.name = name
+        obj.location = location
+        obj.rotation_euler = rotation
+        obj.scale = scale
 
-        temp_path = tempfile.mktemp(suffix=".png")
+        return {
+            "name": obj.name,
+            "type": object_type,
+            "location": list(obj.location),
+        }
 
-        try:
-            # Find the target area
-            target_area = None
-            target_region = None
-            target_window = None
-
-            for window in bpy.context.window_manager.windows:
-                for area in window.screen.areas:
-                    if area.type == area_type:
-                        target_area = area
-                        target_window = window
-                        for region in area.regions:
-                            if region.type == "WINDOW":
-                                target_region = region
-                                break
-                        break
-                if target_area:
+    def modify_object(
+        self, object_name, location=None, rotation=None, scale=None, visible=None
+    ):
+        """Update an object's transform and visibility"""
+        obj = bpy.data.objects.get(object_name)
+        if not obj:
+            raise ValueError(f"Object not found: {object_name}")
+
+        modified = []
+        if location is not None:
+            obj.location = location
+            modified.append("location")
+        if rotation is not None:
+            obj.rotation_euler = rotation
+            modified.append("rotation")
+        if scale is not None:
+            obj.scale = scale
+            modified.append("scale")
+        if visible is not None:
+            obj.hide_set(not visible)
+            modified.append("visibility")
+
+        return {"object": obj.name, "modified": modified}
+
+    def delete_object(self, object_name):
+        """Delete an object from the scene"""
+        obj = bpy.data.objects.get(object_name)
+        if not obj:
+            raise ValueError(f"Object not found: {object_name}")
+
+        bpy.data.objects.remove(obj, do_unlink=True)
+        return {"deleted": object_name}
+
+    def select_objects(self, object_names, deselect_all=True):
+        """Select objects by name, making the first one active"""
+        if deselect_all:
+            bpy.ops.object.select_all(action="DESELECT")
+
+        objects = bpy.data.objects
+        selected = []
+        missing = []
+        first = None
+        for name in object_names:
+            obj = objects.get(name)
+            if obj:
+                obj.select_set(True)
+                selected.append(name)
+                if first is None:
+                    first = obj
+            else:
+                missing.append(name)
+
+        if first is not None:
+            bpy.context.view_layer.objects.active = first
+
+        return {"selected": selected, "missing": missing}
+
+    def get_viewport_screenshot(self, max_size=800, area_type="VIEW_3D"):
+        """Capture screenshot of a specific editor area and return the PNG"""
+        # Find the target area
+        target_area = None
+        target_region = None
+        target_window = None
+
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == area_type:
+                    target_area = area
+                    target_window = window
+                    for region in area.regions:
+                        if region.type == "WINDOW":
+                            target_region = region
+                            break
                     break
+            if target_area:
+                break
+
+        if not target_area or not target_region:
+            raise Exception(f"No {area_type} area found")
+
+        # A 3D viewport can be drawn straight into GPU memory at the target
+        # size, which skips the screenshot file, reloading and rescaling it.
+        if area_type == "VIEW_3D":
+            try:
+                return self._draw_view3d_png(target_area, target_region, max_size)
+            except Exception as e:
+                print(f"BlenderMCP: Offscreen capture failed, using screenshot: {e}")
 
-            if not target_area or not target_region:
-                raise Exception(f"No {area_type} area found")
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+        temp_path = temp_file.name
+        temp_file.close()
 
+        try:
             # Store screenshot result
             screenshot_result = {"success": False, "error": None}
 
@@ -346,9 +717,7 @@ class BlenderMCPServer:
 
                     # Read the resized image
                     with open(temp_path, "rb") as f:
-                        image_data = base64.b64encode(f.read()).decode("utf-8")
-
-                    return {"image_data": image_data}
+                        return f.read()
                 finally:
                     # Remove the loaded image from Blender
                     bpy.data.images.remove(image)
@@ -362,19 +731,118 @@ class BlenderMCPServer:
             except:
                 pass
 
+    def _draw_view3d_png(self, area, region, max_size):
+        """Draw a 3D viewport offscreen and return it as PNG bytes"""
+        # Calculate dimensions maintaining aspect ratio
+        width, height = region.width, region.height
+        if width > max_size or height > max_size:
+            if width > height:
+                width, height = max_size, max(1, int(height * (max_size / width)))
+            else:
+                width, height = max(1, int(width * (max_size / height))), max_size
+
+        space = area.spaces.active
+        offscreen = gpu.types.GPUOffScreen(width, height)
+        try:
+            offscreen.draw_view3d(
+                bpy.context.scene,
+                bpy.context.view_layer,
+                space,
+                region,
+                space.region_3d.view_matrix,
+                space.region_3d.window_matrix,
+                do_color_management=True,
+            )
+            with offscreen.bind():
+                framebuffer = gpu.state.active_framebuffer_get()
+                buffer = framebuffer.read_color(0, 0, width, height, 4, 0, "UBYTE")
+        finally:
+            offscreen.free()
+
+        # GPU rows run bottom to top; PNG wants top to bottom, RGB, and a
+        # filter type byte (0 = none) in front of every row.
+        pixels = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+        rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+        rows[:, 1:] = pixels[::-1, :, :3].reshape(height, width * 3)
+
+        def chunk(tag, data):
+            return (
+                struct.pack(">I", len(data))
+                + tag
+                + data
+                + struct.pack(">I", zlib.crc32(tag + data))
+            )
+
+        return b"".join(
+            (
+                b"\x89PNG\r\n\x1a\n",
+                chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+                chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)),
+                chunk(b"IEND", b""),
+            )
+        )
+
+    def render_image(self, resolution_x=1920, resolution_y=1080, samples=128):
+        """Render the scene and return the result as PNG bytes"""
+        scene = bpy.context.scene
+        render = scene.render
+        use_cycles = render.engine == "CYCLES"
+
+        # Save current settings
+        old_res_x = render.resolution_x
+        old_res_y = render.resolution_y
+        old_format = render.image_settings.file_format
+        old_samples = scene.cycles.samples if use_cycles else None
+
+        render.resolution_x = resolution_x
+        render.resolution_y = resolution_y
+        render.image_settings.file_format = "PNG"
+        if use_cycles:
+            scene.cycles.samples = samples
+
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
+        temp_path = temp_file.name
+        temp_file.close()
+
+        try:
+            bpy.ops.render.render()
+            bpy.data.images["Render Result"].save_render(filepath=temp_path)
+
+            # The PNG is sent back in the response, so the MCP server never
+            # has to share a filesystem with Blender
+            with open(temp_path, "rb") as f:
+                image_data = f.read()
+        finally:
+            render.resolution_x = old_res_x
+            render.resolution_y = old_res_y
+            render.image_settings.file_format = old_format
+            if old_samples:
+                scene.cycles.samples = old_samples
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+
+        return image_data
+
     _exec_namespace = {"bpy": bpy}
 
-    def execute_code(self, code):
+    def execute_code(self, code, capture_output=True):
         """Execute Python code with shared state across calls"""
         try:
             # Ensure bpy is always available
             self._exec_namespace["bpy"] = bpy
-            capture_buffer = io.StringIO()
+            if capture_output:
+                capture_buffer = io.StringIO()
 
-            with redirect_stdout(capture_buffer):
-                exec(code, self._exec_namespace)
+                with redirect_stdout(capture_buffer):
+                    exec(_compile_code(code), self._exec_namespace)
 
-            output = capture_buffer.getvalue()
+                output = capture_buffer.getvalue()
+            else:
+                # Anything printed goes to Blender's own console
+                exec(_compile_code(code), self._exec_namespace)
+                output = ""
             if not output.strip():
                 output = "Code executed successfully (no output)"
             return {"executed": True, "output": output}
@@ -393,49 +861,36 @@ class BlenderMCPServer:
             )
         return libraries
 
-    def list_assets(self, library_name, search="", offset=0, limit=50):
-        """List assets available in a specific library"""
-        # Find the library path from preferences
-        library_path = None
+    def _library_path(self, library_name):
+        """Resolve an asset library name to its path"""
+        # Read from the preferences on every call, so a library that was
+        # renamed or pointed at another folder is picked up right away
         for lib in bpy.context.preferences.filepaths.asset_libraries:
             if lib.name == library_name:
-                library_path = lib.path
-                break
+                return lib.path
+        raise ValueError(f"Asset library not found: {library_name}")
 
-        if library_path is None:
-            raise ValueError(f"Asset library not found: {library_name}")
-
-        if not os.path.isdir(library_path):
-            raise ValueError(f"Asset library path does not exist: {library_path}")
+    def list_assets(self, library_name, search="", offset=0, limit=50):
+        """List assets available in a specific library"""
+        library_path = self._library_path(library_name)
+        search_lower = search.lower()
+        key = (library_path, search_lower)
+        now = time.monotonic()
+        cached = self._asset_pages.get(key)
+        if cached is not None and cached[0] > now:
+            assets = cached[1]
+        else:
+            assets = self._scan_library(library_path)
 
-        # Scan for asset folders containing .blend files
-        assets = []
-        for entry in sorted(os.listdir(library_path)):
-            entry_path = os.path.join(library_path, entry)
-            if os.path.isdir(entry_path):
-                blend_files = [
-                    f for f in os.listdir(entry_path) if f.endswith(".blend")
-                ]
-                if blend_files:
-                    assets.append(
-                        {
-                            "name": entry,
-                            "blend_file": blend_files[0],
-                        }
-                    )
-            elif entry.endswith(".blend"):
-                # Also handle .blend files directly in the library root
-                assets.append(
-                    {
-                        "name": os.path.splitext(entry)[0],
-                        "blend_file": entry,
-                    }
-                )
+            # Apply search filter
+            if search_lower:
+                assets = [a for a in assets if search_lower in a["name"].lower()]
 
-        # Apply search filter
-        if search:
-            search_lower = search.lower()
-            assets = [a for a in assets if search_lower in a["name"].lower()]
+            # Drop expired listings so the cache only holds recent ones
+            self._asset_pages = {
+                k: v for k, v in self._asset_pages.items() if v[0] > now
+            }
+            self._asset_pages[key] = (now + _ASSET_PAGE_TTL, assets)
 
         total = len(assets)
         assets = assets[offset : offset + limit]
@@ -448,32 +903,73 @@ class BlenderMCPServer:
             "assets": assets,
         }
 
+    def _scan_library(self, library_path):
+        """List the assets in a library folder, reusing unchanged folder scans"""
+        # The root is listed on every call, so assets added or removed there
+        # always show up. Each asset folder is only rescanned when its own
+        # mtime has changed, which is what adding, removing or renaming a
+        # .blend inside it does.
+        try:
+            with os.scandir(library_path) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise ValueError(
+                f"Asset library path does not exist: {library_path}"
+            ) from e
+
+        cached = self._asset_scans.get(library_path, {})
+        folders = {}
+        assets = []
+        for entry in entries:
+            if entry.is_dir():
+                mtime = entry.stat().st_mtime_ns
+                scan = cached.get(entry.name)
+                if scan is None or scan[0] != mtime:
+                    with os.scandir(entry.path) as files:
+                        blend_file = next(
+                            (f.name for f in files if f.name.endswith(_BLEND_SUFFIX)),
+                            None,
+                        )
+                    scan = (mtime, blend_file)
+                folders[entry.name] = scan
+                if scan[1]:
+                    assets.append(
+                        {
+                            "name": entry.name,
+                            "blend_file": scan[1],
+                        }
+                    )
+            elif entry.name.endswith(_BLEND_SUFFIX):
+                # Also handle .blend files directly in the library root
+                assets.append(
+                    {
+                        "name": entry.name[: -len(_BLEND_SUFFIX)],
+                        "blend_file": entry.name,
+                    }
+                )
+
+        # Folders that are gone drop out of the cache here
+        self._asset_scans[library_path] = folders
+        return assets
+
     def append_asset(self, library_name, asset_name, location=None):
         """Append an asset from a library into the current scene"""
         if location is None:
             location = [0, 0, 0]
 
-        # Find the library path from preferences
-        library_path = None
-        for lib in bpy.context.preferences.filepaths.asset_libraries:
-            if lib.name == library_name:
-                library_path = lib.path
-                break
-
-        if library_path is None:
-            raise ValueError(f"Asset library not found: {library_name}")
+        library_path = self._library_path(library_name)
 
         # Find the .blend file for this asset
         blend_path = None
         asset_dir = os.path.join(library_path, asset_name)
         if os.path.isdir(asset_dir):
             for f in os.listdir(asset_dir):
-                if f.endswith(".blend"):
+                if f.endswith(_BLEND_SUFFIX):
                     blend_path = os.path.join(asset_dir, f)
                     break
         else:
             # Check for .blend file directly in library root
-            candidate = os.path.join(library_path, asset_name + ".blend")
+            candidate = os.path.join(library_path, asset_name + _BLEND_SUFFIX)
             if os.path.isfile(candidate):
                 blend_path = candidate
 
@@ -530,60 +1026,41 @@ class BlenderMCPServer:
 
         modifiers = []
         for mod in obj.modifiers:
+            mod_type = mod.type
+            properties = {}
             mod_info = {
                 "name": mod.name,
-                "type": mod.type,
-                "properties": {},
+                "type": mod_type,
+                "properties": properties,
             }
 
-            # Common properties by type
-            prop_map = {
-                "SUBSURF": ["levels", "render_levels", "uv_smooth", "quality"],
-                "BEVEL": ["width", "segments", "limit_method", "offset_type"],
-                "ARRAY": [
-                    "count",
-                    "use_relative_offset",
-                    "use_constant_offset",
-                    "relative_offset_displace",
-                    "constant_offset_displace",
-                ],
-                "MIRROR": ["use_axis", "use_bisect_axis", "merge_threshold"],
-                "BOOLEAN": ["operation", "solver"],
-                "SOLIDIFY": ["thickness", "offset", "use_even_offset"],
-                "WIREFRAME": ["thickness", "use_replace", "use_even_offset"],
-                "DECIMATE": ["decimate_type", "ratio", "angle_limit"],
-                "REMESH": ["mode", "octree_depth", "voxel_size"],
-                "SMOOTH": ["factor", "iterations"],
-                "SHRINKWRAP": ["wrap_method", "wrap_mode", "offset"],
-                "CURVE": ["deform_axis"],
-            }
-
-            props_to_read = prop_map.get(mod.type, [])
-            for prop_name in props_to_read:
-                try:
-                    val = getattr(mod, prop_name)
-                    # Convert Blender types to JSON-serializable
-                    if isinstance(val, bpy.types.ID):
-                        val = val.name if val else None
-                    elif hasattr(val, "__iter__") and not isinstance(val, str):
-                        val = list(val)
-                    mod_info["properties"][prop_name] = val
-                except AttributeError:
-                    pass
+            for prop_name in _MODIFIER_PROPERTIES.get(mod_type, ()):
+                val = getattr(mod, prop_name, _MISSING)
+                if val is _MISSING:
+                    continue
+                # Convert Blender types to JSON-serializable
+                if isinstance(val, bpy.types.ID):
+                    val = val.name if val else None
+                elif hasattr(val, "__iter__") and not isinstance(val, str):
+                    val = list(val)
+                properties[prop_name] = val
 
             # Geometry Nodes special handling
-            if mod.type == "NODES" and mod.node_group:
-                mod_info["node_group"] = mod.node_group.name
-                mod_info["inputs"] = []
-                for item in mod.node_group.interface.items_tree:
+            node_group = mod.node_group if mod_type == "NODES" else None
+            if node_group:
+                inputs = []
+                mod_info["node_group"] = node_group.name
+                mod_info["inputs"] = inputs
+                for item in node_group.interface.items_tree:
                     if item.item_type == "SOCKET" and item.in_out == "INPUT":
+                        identifier = item.identifier
                         input_info = {
-                            "identifier": item.identifier,
+                            "identifier": identifier,
                             "name": item.name,
                             "socket_type": item.socket_type,
                         }
                         try:
-                            val = mod[item.identifier]
+                            val = mod[identifier]
                             if isinstance(val, bpy.types.ID):
                                 val = val.name if val else None
                             elif hasattr(val, "__iter__") and not isinstance(val, str):
@@ -591,7 +1068,7 @@ class BlenderMCPServer:
                             input_info["value"] = val
                         except (KeyError, TypeError):
                             input_info["value"] = None
-                        mod_info["inputs"].append(input_info)
+                        inputs.append(input_info)
 
             modifiers.append(mod_info)
 
@@ -689,29 +1166,27 @@ class BlenderMCPServer:
             raise ValueError(f"Modifier '{modifier_name}' has no node group assigned")
 
         # Find input by identifier or display name
-        target_identifier = None
-        for item in mod.node_group.interface.items_tree:
+        items = mod.node_group.interface.items_tree
+        target_item = None
+        for item in items:
             if item.item_type == "SOCKET" and item.in_out == "INPUT":
                 if item.identifier == input_name or item.name == input_name:
-                    target_identifier = item.identifier
+                    target_item = item
                     break
 
-        if target_identifier is None:
+        if target_item is None:
             available = [
                 f"{item.identifier} ({item.name})"
-                for item in mod.node_group.interface.items_tree
+                for item in items
                 if item.item_type == "SOCKET" and item.in_out == "INPUT"
             ]
             raise ValueError(
                 f"Input not found: '{input_name}'. Available inputs: {available}"
             )
 
-        # Determine socket type to handle ID properties (Object, Collection, etc.)
-        socket_type = None
-        for item in mod.node_group.interface.items_tree:
-            if item.identifier == target_identifier:
-                socket_type = item.socket_type
-                break
+        target_identifier = target_item.identifier
+        # Socket type is needed to handle ID properties (Object, Collection, etc.)
+        socket_type = target_item.socket_type
 
         if socket_type == "NodeSocketObject" and isinstance(value, str):
             ref = bpy.data.objects.get(value)
@@ -771,14 +1246,17 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
 
         row = box.row()
         row.prop(scene, "blendermcp_port")
+        row = box.row()
+        row.prop(scene, "blendermcp_socket_path")
 
         global _server
         if _server and _server.running:
+            if _server.socket_path:
+                status = f"Status: Running on {_server.socket_path}"
+            else:
+                status = f"Status: Running on port {_server.port}"
             row = box.row()
-            row.label(
-                text=f"Status: Running on port {scene.blendermcp_port}",
-                icon="CHECKMARK",
-            )
+            row.label(text=status, icon="CHECKMARK")
             row = box.row()
             row.operator("blendermcp.stop_server", icon="PAUSE")
         else:
@@ -796,13 +1274,19 @@ class BLENDERMCP_OT_StartServer(bpy.types.Operator):
 
     def execute(self, context):
         global _server
-        if not _server:
-            _server = BlenderMCPServer(port=context.scene.blendermcp_port)
+        scene = context.scene
+        # Pick up port/socket path changes made while the server was stopped
+        if not _server or not _server.running:
+            _server = BlenderMCPServer(
+                port=scene.blendermcp_port,
+                socket_path=scene.blendermcp_socket_path,
+            )
 
         _server.start()
-        self.report(
-            {"INFO"}, f"MCP Server started on port {context.scene.blendermcp_port}"
-        )
+        if _server.socket_path:
+            self.report({"INFO"}, f"MCP Server started on {_server.socket_path}")
+        else:
+            self.report({"INFO"}, f"MCP Server started on port {_server.port}")
         return {"FINISHED"}
 
 
@@ -840,6 +1324,12 @@ def register():
         min=1024,
         max=65535,
     )
+    bpy.types.Scene.blendermcp_socket_path = StringProperty(
+        name="Socket Path",
+        description="Listen on this Unix socket instead of the TCP port "
+        "(leave empty to use the port)",
+        default="",
+    )
 
 
 def unregister():
@@ -852,6 +1342,7 @@ def unregister():
         bpy.utils.unregister_class(cls)
 
     del bpy.types.Scene.blendermcp_port
+    del bpy.types.Scene.blendermcp_socket_path
 
 
 if __name__ == "__main__":